@@ -17,9 +17,7 @@ release = '1.9.3.dev0'
 extensions = [
     'sphinx.ext.autosectionlabel',
     'sphinx.ext.autodoc',
-    'sphinx.ext.autosummary',
     'sphinx.ext.viewcode',
-    'sphinx_autodoc_typehints',
     'sphinx-prompt',
     'sphinxcontrib.programoutput',
 ]
@@ -37,6 +35,7 @@ html_static_path = ['_static']
 html_css_files = [
     'project.css',
 ]
-typehints_fully_qualified = True
-always_document_param_types = True
+autodoc_typehints = 'description'
+autodoc_typehints_format = 'short'
+python_use_unqualified_type_names = True
 autodoc_member_order = 'bysource'
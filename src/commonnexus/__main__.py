@@ -1,21 +1,25 @@
 import sys
 import logging
-import pathlib
 import argparse
 import importlib
-import contextlib
 
 import commonnexus
 import commonnexus.commands
+from commonnexus.cli_util import ParserError
+from commonnexus.commands._registry import COMMANDS
 
 
 def get_log(name, level=logging.INFO) -> logging.Logger:
-    logging.basicConfig(level=level)
     log = logging.getLogger(name)
-    handler = logging.StreamHandler(stream=sys.stderr)
+    # Make sure repeated calls do not pile up handlers:
+    for handler in log.handlers:
+        if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stderr:
+            break
+    else:
+        handler = logging.StreamHandler(stream=sys.stderr)
+        handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
+        log.addHandler(handler)
     handler.setLevel(level)
-    handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
-    log.addHandler(handler)
     log.setLevel(level)
     log.propagate = False
     return log
@@ -24,41 +28,82 @@ def get_log(name, level=logging.INFO) -> logging.Logger:
 class Logging(object):
     """
     A context manager to execute a block of code at a specific logging level.
+
+    Only the level of the logger is changed - handlers and the root logger are left alone.
     """
 
     def __init__(self, logger, level=logging.DEBUG):  # pragma: no cover
         self.level = level
         self.logger = logger
-        self.prev_level = self.logger.getEffectiveLevel()
-        root = logging.getLogger()
-        self.root_logger_level = root.getEffectiveLevel()
-        self.root_handler_level = root.handlers[0].level if root.handlers else logging.WARNING
+        self.prev_level = self.logger.level
 
     def __enter__(self):  # pragma: no cover
         self.logger.setLevel(self.level)
-        if self.logger.handlers:
-            self.logger.handlers[0].setLevel(self.level)
-        root = logging.getLogger()
-        root.setLevel(self.level)
-        if root.handlers:
-            root.handlers[0].setLevel(self.level)
         return self.logger
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # pragma: no cover
         self.logger.setLevel(self.prev_level)
-        root = logging.getLogger()
-        root.setLevel(self.root_logger_level)
-        if root.handlers:
-            root.handlers[0].setLevel(self.root_handler_level)
 
 
 class Formatter(argparse.ArgumentDefaultsHelpFormatter, argparse.RawDescriptionHelpFormatter):
     pass
 
 
-def main(args=None, catch_all=False, parsed_args=None, log=None):
-    from commonnexus.cli_util import ParserError
+class CommandParser(argparse.ArgumentParser):
+    """
+    Parser for a subcommand, looking up the description from the implementing module only when
+    help is actually formatted.
+    """
+    def __init__(self, *args, **kw):
+        self.command = kw.pop('command', None)
+        super().__init__(*args, **kw)
+
+    def format_help(self):
+        if self.description is None and self.command:
+            self.description = _command_help(_command_module(self.command))
+        return super().format_help()
+
+
+def _command_module(name):
+    return importlib.import_module('.{}'.format(name), commonnexus.commands.__name__)
+
+
+def _command_help(mod):
+    return mod.help() if hasattr(mod, 'help') else mod.__doc__
+
 
+def _lazy_run(name):
+    """
+    Returns a function to run subcommand `name`, deferring the import of the implementing module
+    until the subcommand is actually dispatched.
+    """
+    def run(args):
+        return _command_module(name).run(args)
+    return run
+
+
+def _sniff_subcommand(argv, known, options_with_value=('--log', '--log-level')):
+    """
+    Determine the requested subcommand from a list of arguments without parsing them.
+
+    :param argv: The command line arguments.
+    :param known: Names of the available subcommands.
+    :param options_with_value: Top-level options which consume the following argument.
+    :return: The subcommand name or `None` if no known subcommand is found or help is requested \
+    before the subcommand.
+    """
+    argv = iter(argv)
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            return None
+        if arg in options_with_value:
+            next(argv, None)
+        elif not arg.startswith('-'):
+            return arg if arg in known else None
+    return None
+
+
+def main(args=None, catch_all=False, parsed_args=None, log=None):
     parser = argparse.ArgumentParser(
         prog=commonnexus.__name__,
         description="{} {} is a set of commands to manipulate of files in the NEXUS "
@@ -66,7 +111,7 @@ def main(args=None, catch_all=False, parsed_args=None, log=None):
         epilog='See https://github.com/dlce-eva/commonnexus for details.',
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
     # Make logging configurable:
-    parser.add_argument('--log', default=get_log(commonnexus.__name__), help=argparse.SUPPRESS)
+    parser.add_argument('--log', default=None, help=argparse.SUPPRESS)
     parser.add_argument(
         '--log-level',
         default=logging.INFO,
@@ -79,16 +124,20 @@ def main(args=None, catch_all=False, parsed_args=None, log=None):
         dest="_command",
         description='Run "{} COMAMND -h" to get help for a specific command.'.format(
             commonnexus.__name__),
-        metavar="COMMAND")
-    for p in sorted(
-            pathlib.Path(__file__).parent.joinpath('commands').glob('*.py'),
-            key=lambda pp: pp.stem):
-        if p.stem == '__init__':
+        metavar="COMMAND",
+        parser_class=CommandParser)
+    argv = sys.argv[1:] if args is None else args
+    # If we can tell which subcommand is requested, only this one needs to be set up fully. For
+    # the top-level help, the short help texts from the registry are all we need.
+    wanted = _sniff_subcommand(argv, COMMANDS)
+    help_only = (not argv) or argv[0] in ('-h', '--help')
+    for name, help in COMMANDS.items():
+        kw = dict(command=name, help=help, formatter_class=Formatter)
+        if help_only or (wanted and name != wanted):
+            subparsers.add_parser(name, **kw).set_defaults(main=_lazy_run(name))
             continue
-        mod = importlib.import_module('.{}'.format(p.stem), commonnexus.commands.__name__)
-        help = mod.help() if hasattr(mod, 'help') else mod.__doc__
-        subparser = subparsers.add_parser(
-            p.stem, help=help.strip().splitlines()[0], description=help, formatter_class=Formatter)
+        mod = _command_module(name)
+        subparser = subparsers.add_parser(name, **kw)
         if hasattr(mod, 'register'):
             mod.register(subparser)
         subparser.set_defaults(main=mod.run)
@@ -99,23 +148,28 @@ def main(args=None, catch_all=False, parsed_args=None, log=None):
         parser.print_help()
         return 1
 
-    with contextlib.ExitStack() as stack:
-        if not log:  # pragma: no cover
-            stack.enter_context(Logging(args.log, level=args.log_level))
-        else:
-            args.log = log
-        try:
-            return args.main(args) or 0
-        except KeyboardInterrupt:  # pragma: no cover
-            return 0
-        except ParserError as e:  # pragma: no cover
-            print(str(e))
-            return main([args._command, '-h'])
-        except Exception as e:  # pragma: no cover
-            if catch_all:
-                print(e)
-                return 1
-            raise
+    at_level = None
+    if log:
+        args.log = log
+    else:  # pragma: no cover
+        args.log = args.log or get_log(commonnexus.__name__, level=args.log_level)
+        at_level = Logging(args.log, level=args.log_level)
+        at_level.__enter__()
+    try:
+        return args.main(args) or 0
+    except KeyboardInterrupt:  # pragma: no cover
+        return 0
+    except ParserError as e:  # pragma: no cover
+        print(str(e))
+        return main([args._command, '-h'])
+    except Exception as e:  # pragma: no cover
+        if catch_all:
+            print(e)
+            return 1
+        raise
+    finally:
+        if at_level:  # pragma: no cover
+            at_level.__exit__(None, None, None)
 
 
 if __name__ == '__main__':  # pragma: no cover
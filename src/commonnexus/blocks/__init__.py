@@ -3,14 +3,47 @@ From the spec:
 
     The eight [sic! It's nine!] primary public blocks are TAXA, CHARACTERS, UNALIGNED, DISTANCES,
     SETS, ASSUMPTIONS, CODONS, TREES, and NOTES.
+
+The modules implementing the public blocks are only imported upon first access of the respective
+class.
 """
+import typing
+import importlib
+
 from .base import Block  # noqa: F401
-from .assumptions import Assumptions  # noqa: F401
-from .characters import Characters, Data  # noqa: F401
-from .codons import Codons  # noqa: F401
-from .distances import Distances  # noqa: F401
-from .notes import Notes  # noqa: F401
-from .sets import Sets  # noqa: F401
-from .taxa import Taxa  # noqa: F401
-from .trees import Trees  # noqa: F401
-from .unaligned import Unaligned  # noqa: F401
+
+# Maps class names of the public blocks to the names of the modules implementing them.
+_LAZY = {
+    'Assumptions': 'assumptions',
+    'Characters': 'characters',
+    'Data': 'characters',
+    'Codons': 'codons',
+    'Distances': 'distances',
+    'Notes': 'notes',
+    'Sets': 'sets',
+    'Taxa': 'taxa',
+    'Trees': 'trees',
+    'Unaligned': 'unaligned',
+}
+PUBLIC_BLOCKS = {name.upper(): name for name in _LAZY}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    cls = getattr(importlib.import_module('.' + _LAZY[name], __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()).union(_LAZY))
+
+
+def get_implementation(name: str) -> typing.Optional[typing.Type[Block]]:
+    """
+    :param name: Uppercase block name.
+    :return: The class implementing the public block `name` or `None` for non-public blocks.
+    """
+    if name in PUBLIC_BLOCKS:
+        return __getattr__(PUBLIC_BLOCKS[name])
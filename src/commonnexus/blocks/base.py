@@ -2,6 +2,7 @@
 Basic building blocks of NEXUS files.
 """
 import re
+import sys
 import typing
 import functools
 import collections
@@ -10,24 +11,56 @@ from commonnexus.tokenizer import (
     get_name, iter_tokens, iter_words_and_punctuation, word_after_equals, TokenType, Word,
 )
 from commonnexus.command import Command
+from commonnexus.util import missing_attribute
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from commonnexus import Nexus
 
+LINE_SEPARATOR = re.compile(r'[\t\r ]*\n[\t\r ]*')
+
+
+@functools.lru_cache(maxsize=1024)
+def _as_nexus_string(s: str) -> str:
+    # Block titles, IDs and link targets recur across the blocks of a file.
+    return Word(s).as_nexus_string()
+
 
 class Payload:
     """
     The payload of a Nexus command, i.e. the stuff between command name and final ";".
     """
     __multivalued__ = False
+    # Payloads are created in bulk - one per command - so we do without per-instance dicts.
+    # Subclasses which do not declare `__slots__` themselves get a `__dict__` as usual.
+    __slots__ = ('nexus', '_raw_tokens', '_token_cache', '_comments', '_str')
 
     def __init__(self, tokens, nexus=None):
         self.nexus = nexus
-        self._tokens = list(iter_tokens(iter(tokens))) if isinstance(tokens, str) else tokens
+        self._raw_tokens = tokens
+        self._token_cache = None
+        self._comments = None
+        self._str = None
 
-    @functools.cached_property
+    @property
+    def _tokens(self):
+        """
+        The payload tokens, materialized on first access. A payload may be passed in as string, as
+        sequence of tokens or as (one-shot) iterator of tokens.
+        """
+        if self._token_cache is None:
+            if isinstance(self._raw_tokens, str):
+                self._token_cache = list(iter_tokens(iter(self._raw_tokens)))
+            elif self._raw_tokens is None or isinstance(self._raw_tokens, (list, tuple)):
+                self._token_cache = self._raw_tokens
+            else:
+                self._token_cache = tuple(self._raw_tokens)
+        return self._token_cache
+
+    @property
     def comments(self):
-        return [t.text for t in self._tokens if t.type == TokenType.COMMENT]
+        if self._comments is None:
+            self._comments = [t.text for t in self._tokens if t.type is TokenType.COMMENT]
+        return self._comments
 
     def format(self, *args, **kw):
         """
@@ -36,11 +69,14 @@ class Payload:
         raise NotImplementedError()  # pragma: no cover
 
     def __str__(self):
-        return ''.join(str(t) for t in self._tokens)
+        # Tokens are not changed after parsing, so we can cache the serialization.
+        if self._str is None:
+            self._str = ''.join(map(str, self._tokens))
+        return self._str
 
     @property
     def lines(self):
-        return re.split(r'[\t\r ]*\n[\t\r ]*', str(self))
+        return LINE_SEPARATOR.split(str(self))
 
 
 class Title(Payload):
@@ -49,6 +85,8 @@ class Title(Payload):
 
     https://phylo.bio.ku.edu/slides/lab9-MesquiteAncStatesBisse/09-Mesquite.html#Create_a_tree_file
     """
+    __slots__ = ('title',)
+
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
         self.title = next(iter_words_and_punctuation(self._tokens, nexus=nexus)).upper()
@@ -61,6 +99,8 @@ class Id(Payload):
 
     https://phylo.bio.ku.edu/slides/lab9-MesquiteAncStatesBisse/09-Mesquite.html#Create_a_tree_file
     """
+    __slots__ = ('id',)
+
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
         self.id = next(iter_words_and_punctuation(self._tokens, nexus=nexus))
@@ -73,6 +113,8 @@ class Link(Payload):
 
     https://phylo.bio.ku.edu/slides/lab9-MesquiteAncStatesBisse/09-Mesquite.html#Create_a_tree_file
     """
+    __slots__ = ('block', 'title')
+
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
         words = iter_words_and_punctuation(self._tokens, nexus=nexus)
@@ -96,68 +138,110 @@ class Block(tuple):
     """
     # Custom `Payload` subclasses can be registered for command names:
     __commands__ = {}
+    # Mapping of command names to `Payload` subclasses, computed once per class:
+    payload_map = dict(LINK=Link, TITLE=Title, ID=Id)
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        cls.payload_map = {sys.intern(c.__name__.upper()): c for c in cls.__commands__}
+        cls.payload_map.update(LINK=Link, TITLE=Title, ID=Id)
 
     def __new__(cls, nexus, cmds):
         return super().__new__(cls, tuple(cmds))
 
     def __init__(self, nexus, cmds):
         self.nexus = nexus
+        self._str = None
+        self._payloads = {}
 
     def __str__(self):
-        return ''.join(str(cmd) for cmd in self)
+        if self._str is None:
+            self._str = ''.join(map(str, self))
+        return self._str
 
-    @functools.cached_property
-    def payload_map(self):
-        res = {cls.__name__.upper(): cls for cls in self.__commands__}
-        res.update(LINK=Link, TITLE=Title, ID=Id)
-        return res
+    def _first_command(self, name):
+        cmds = self._get_payloads(name)
+        return cmds[0] if cmds else None
 
     @property
     def id(self):
-        if self.ID:
-            return self.ID.id
+        cmd = self._first_command('ID')
+        if cmd:
+            return cmd.id
 
     @property
     def title(self):
-        if self.TITLE:
-            return self.TITLE.title
+        cmd = self._first_command('TITLE')
+        if cmd:
+            return cmd.title
 
     @property
     def links(self):
-        return {link.block: link.title for link in self.commands['LINK']}
+        return {link.block: link.title for link in self._get_payloads('LINK')}
 
     @property
     def linked_blocks(self):
+        links = self.links
+        if not links or self.nexus is None:
+            return {}
         res = {}
-        for name, title in self.links.items():
-            for block in self.nexus.blocks.get(name, []):
-                if block.title == title:
-                    res[name] = block
+        # Note: Nexus.blocks instantiates all blocks of the NEXUS content, so we only call it once,
+        # to build an index of the linked blocks by title.
+        blocks = self.nexus.blocks
+        index = {name: {block.title: block for block in blocks.get(name, [])} for name in links}
+        for name, title in links.items():
+            if title in index[name]:
+                res[name] = index[name][title]
         return res
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
+        # Only called when regular attribute lookup fails, i.e. for command names - or when a
+        # property raises AttributeError.
         if name.isupper():
-            try:
-                return self.commands[name][0]
-            except IndexError:
-                return None
-        return super().__getattribute__(name)
+            return self._first_command(name)
+        return missing_attribute(self, name)
 
     @functools.cached_property
     def name(self):
         return get_name(self[0].iter_payload_tokens())
 
+    @functools.cached_property
+    def _commands_by_name(self):
+        res = {}
+        for cmd in self[1:-1]:
+            res.setdefault(cmd.name, []).append(cmd)
+        return res
+
+    def _get_payloads(self, name):
+        """
+        Payloads are only parsed when commands with the name are accessed for the first time.
+        """
+        res = self._payloads.get(name)
+        if res is None:
+            cls, nexus = self.payload_map.get(name, Payload), self.nexus
+            res = self._payloads[name] = [
+                cls(cmd.iter_payload_tokens(), nexus=nexus)
+                for cmd in self._commands_by_name.get(name, [])]
+        return res
+
     @functools.cached_property
     def commands(self):
+        # Note: We keep returning a defaultdict, because looking up missing commands by name is
+        # part of the API.
         res = collections.defaultdict(list)
-        for cmd in self:
-            if not (cmd.is_beginblock or cmd.is_endblock):
-                cls = self.payload_map.get(cmd.name, Payload)
-                res[cmd.name].append(cls(tuple(cmd.iter_payload_tokens()), nexus=self.nexus))
+        for name in self._commands_by_name:
+            res[name] = self._get_payloads(name)
         return res
 
-    def validate(self, log=None):
-        ncmds = sum(len(cmds) for cmds in self.commands.values())
+    def validate(self, log=None, deep=True):
+        """
+        :param deep: If `True`, the payloads of all commands are parsed - and hence checked - \
+        rather than only counted.
+        """
+        if deep:
+            ncmds = sum(len(cmds) for cmds in self.commands.values())
+        else:
+            ncmds = len(self) - 2  # Don't count BEGIN and END.
         if log:
             log.debug('{} block with {} commands'.format(self.name, ncmds))
         return True
@@ -209,10 +293,10 @@ class Block(tuple):
         if TITLE:
             cmds.append(
                 Command.from_name_and_payload(
-                    'TITLE', Word(TITLE).as_nexus_string(), in_block=True))
+                    'TITLE', _as_nexus_string(TITLE), in_block=True))
         if ID:
             cmds.append(
-                Command.from_name_and_payload('ID', Word(ID).as_nexus_string(), in_block=True))
+                Command.from_name_and_payload('ID', _as_nexus_string(ID), in_block=True))
         if LINK:
             if isinstance(LINK, str):
                 block, _, title = LINK.partition('=')
@@ -220,7 +304,7 @@ class Block(tuple):
             else:
                 assert isinstance(LINK, tuple) and len(LINK) == 2
             cmds.append(Command.from_name_and_payload('LINK', '{} = {}'.format(
-                Word(LINK[0]).as_nexus_string(), Word(LINK[1]).as_nexus_string()), in_block=True))
+                _as_nexus_string(LINK[0]), _as_nexus_string(LINK[1])), in_block=True))
         for cmdspec in commands:
             payload, comment = None, None
             if isinstance(cmdspec, str):
@@ -1,13 +1,14 @@
-import types
+import re
 import typing
 import warnings
-import functools
+import dataclasses
 import collections
 
 from .base import Block, Payload
 from commonnexus.util import log_or_raise
 from commonnexus.tokenizer import (
     iter_words_and_punctuation, Token, iter_delimited, iter_lines, BOOLEAN, word_after_equals, Word,
+    TokenType,
 )
 from .taxa import Taxlabels
 
@@ -22,6 +23,56 @@ StateMatrix = typing.OrderedDict[str, typing.OrderedDict[str, State]]
 GAP = '\uFFFD'  # REPLACEMENT CHARACTER used to replace an [...] unrepresentable character
 #: Some - but not all - punctuation is invalid as (special) state symbol.
 INVALID_SYMBOLS = "()[]{}/\\,;:=*'\"*`<>^"
+INVALID_SYMBOLS_SET = frozenset(INVALID_SYMBOLS)
+# The subcommands of DIMENSIONS are simple enough to be read from the payload text with a regex:
+DIMENSIONS_SUBCOMMAND = re.compile(
+    r'(?<!\S)(?:(NEWTAXA)|(NTAX|NCHAR)\s*=\s*([^\s;]+))(?!\S)', flags=re.IGNORECASE)
+# FORMAT subcommands taking a value:
+FORMAT_VALUE_SUBCOMMANDS = frozenset({'DATATYPE', 'MISSING', 'MATCHCHAR', 'GAP', 'STATESFORMAT'})
+# Valid values of the FORMAT subcommands DATATYPE, ITEMS and STATESFORMAT:
+FORMAT_DATATYPES = frozenset({'STANDARD', 'DNA', 'RNA', 'NUCLEOTIDE', 'PROTEIN', 'CONTINUOUS'})
+FORMAT_ITEMS = frozenset(
+    {'MIN', 'MAX', 'MEDIAN', 'AVERAGE', 'VARIANCE', 'STDERROR', 'SAMPLESIZE', 'STATES'})
+FORMAT_STATESFORMATS = frozenset({'STATESPRESENT', 'INDIVIDUALS', 'COUNT', 'FREQUENCY'})
+# FORMAT subcommands switching on (or off) a boolean option, mapped to (attribute, value):
+FORMAT_SWITCHES = {
+    'RESPECTCASE': ('respectcase', True),
+    'TRANSPOSE': ('transpose', True),
+    'INTERLEAVE': ('interleave', True),
+    'LABELS': ('labels', True),
+    'NOLABELS': ('labels', False),
+    'TOKENS': ('tokens', True),
+    'NOTOKENS': ('tokens', False),
+}
+
+
+def _nucleotide_equate(T):
+    return {
+        k: frozenset(v) for k, v in dict(
+            R='AG', Y='C' + T, M='AC', K='G' + T, S='CG', W='A' + T, H='AC' + T, B='CG' + T,
+            V='ACG', D='AG' + T, N='ACG' + T, X='ACG' + T).items()}
+
+
+# The state symbols and EQUATE macros implied by the molecular DATATYPEs:
+DATATYPE_SYMBOLS = dict(DNA='ACGT', RNA='ACGU', NUCLEOTIDE='ACGT', PROTEIN='ACDEFGHIKLMNPQRSTVWY*')
+DATATYPE_EQUATE = dict(
+    DNA=_nucleotide_equate('T'),
+    RNA=_nucleotide_equate('U'),
+    NUCLEOTIDE=dict(_nucleotide_equate('T'), U='T'),
+    PROTEIN=dict(B=frozenset('DN'), Z=frozenset('EQ')),
+)
+
+
+@dataclasses.dataclass
+class Character:
+    """
+    Number, name and state labels of a character as specified in CHARLABELS, CHARSTATELABELS or
+    STATELABELS.
+    """
+    __slots__ = ['number', 'name', 'states']
+    number: int
+    name: typing.Optional[str]
+    states: typing.List[str]
 
 
 def duplicate_charlabel(label, cmd, nexus):
@@ -32,6 +83,13 @@ def duplicate_charlabel(label, cmd, nexus):
             'Duplicate character name "{}" in {} command'.format(label, cmd))
 
 
+def check_duplicate_charlabels(labels, cmd, nexus):
+    # Counting all labels in one pass, we report each repeated occurrence of a label.
+    for label, count in collections.Counter(label for label in labels if label).items():
+        for _ in range(count - 1):
+            duplicate_charlabel(label, cmd, nexus)
+
+
 class Eliminate(Payload):
     """
     This command allows specification of a list of characters that are to be excluded from
@@ -72,34 +130,26 @@ class Dimensions(Payload):
     :ivar typing.Optional[int] ntax:
     :ivar int nchar:
     """
+    __slots__ = ('newtaxa', 'ntax', 'nchar')
+
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
         self.newtaxa = False
         self.ntax = None
-        self.char = None
-        words = iter_words_and_punctuation(self._tokens, nexus=nexus)
-        while 1:
-            try:
-                word = next(words)
-                subcommand = None
-                if isinstance(word, str):
-                    subcommand = word.upper()
-                if subcommand == 'NEWTAXA':
-                    self.newtaxa = True
-                elif subcommand == 'NTAX':
-                    n = next(words)
-                    assert n.text == '='
-                    self.ntax = int(next(words))
-                elif subcommand == 'NCHAR':
-                    n = next(words)
-                    assert n.text == '='
-                    self.nchar = int(next(words))
-            except StopIteration:
-                break
+        self.nchar = None
+        # Comments may appear anywhere - even within words - so we remove them before scanning.
+        text = ''.join(t.text for t in self._tokens if t.type is not TokenType.COMMENT)
+        for newtaxa, subcommand, value in DIMENSIONS_SUBCOMMAND.findall(text):
+            if newtaxa:
+                self.newtaxa = True
+            else:
+                # Values may be given as quoted NEXUS words:
+                setattr(self, subcommand.lower(), int(value.strip("'")))
         self.check()
 
     def check(self):
-        assert self.nchar and ((not self.newtaxa) or self.ntax)
+        assert self.nchar is not None and ((not self.newtaxa) or self.ntax is not None), \
+            'NCHAR is required, NTAX is required if NEWTAXA is specified'
 
 
 class Format(Payload):
@@ -309,7 +359,7 @@ class Format(Payload):
     :ivar str missing:
     :ivar typing.Optional[str] gap:
     :ivar typing.List[str] symbols:
-    :ivar typing.Dict[str, str] equate:
+    :ivar typing.Dict[str, typing.Union[str, typing.Tuple[str], typing.FrozenSet[str]]] equate:
     :ivar typing.Optional[str] matchchar:
     :ivar typing.Optional[bool] labels:
     :ivar bool transpose:
@@ -324,6 +374,10 @@ class Format(Payload):
         code. Instead, the information is accessed when reading the matrix data in
         :meth:`Characters.get_matrix`.
     """
+    __slots__ = (
+        'datatype', 'respectcase', 'missing', 'gap', 'symbols', 'equate', 'matchchar', 'labels',
+        'transpose', 'interleave', 'items', 'statesformat', 'tokens', 'explicit_symbols')
+
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
         self.datatype = None
@@ -344,141 +398,125 @@ class Format(Payload):
         if tokens is None:
             return
 
-        words = iter_words_and_punctuation(self._tokens, nexus=nexus)
-        after_equals = functools.partial(word_after_equals, words)
+        # An empty payload still needs the defaults to be completed and checked below.
+        words = iter_words_and_punctuation(self._tokens, nexus=nexus) if self._tokens else iter(())
 
         subcommand = None
         subcommands_set = set()
-        while 1:
-            try:
-                word = next(words)
+        try:
+            for word in words:
                 if isinstance(word, str):
                     subcommand = word.upper()
                 elif isinstance(word, Token) and word.text == '=':
-                    if subcommand in ['RESPECTCASE', 'TRANSPOSE', 'INTERLEAVE', 'LABELS', 'TOKENS']:
+                    if subcommand in FORMAT_SWITCHES and FORMAT_SWITCHES[subcommand][1]:
                         # Some NEXUS variants set boolean subcommands always with "=no|yes"
                         word = next(words).lower()
                         if subcommand == 'LABELS' and word == 'left':
                             word = 'yes'
-                        setattr(self, subcommand.lower(), BOOLEAN[word])
+                        setattr(self, FORMAT_SWITCHES[subcommand][0], BOOLEAN[word])
                         subcommands_set.add(subcommand)
                     elif subcommand:  # pragma: no cover
                         raise ValueError(subcommand)
 
-                if subcommand in ['DATATYPE', 'MISSING', 'MATCHCHAR', 'GAP', 'STATESFORMAT']:
-                    setattr(self, subcommand.lower(), after_equals())
+                if subcommand in FORMAT_VALUE_SUBCOMMANDS:
+                    setattr(self, subcommand.lower(), word_after_equals(words))
                     if subcommand == 'DATATYPE' and self.datatype.upper() != 'STANDARD':
                         self.symbols = []
-                elif subcommand in ['RESPECTCASE', 'TRANSPOSE', 'INTERLEAVE']:
+                elif subcommand in FORMAT_SWITCHES:
                     if subcommand not in subcommands_set:
-                        setattr(self, subcommand.lower(), True)
-                elif subcommand in ['NOLABELS', 'LABELS', 'NOTOKENS', 'TOKENS']:
-                    setattr(self, subcommand.replace('NO', '').lower(), 'NO' not in subcommand)
-                elif subcommand == 'SYMBOLS':
-                    self.explicit_symbols = True
-                    self.symbols = []
-                    next_token_text = after_equals()
-                    if not next_token_text.startswith('"'):
-                        self.symbols = list(next_token_text)
-                    else:
-                        for w in iter_delimited(next_token_text, words):
-                            if isinstance(w, str):
-                                self.symbols.extend(list(w))
-                            else:
-                                assert w.text in '+-'
-                                self.symbols.append(w.text)
-                elif subcommand == 'EQUATE':
-                    key, e, bracket = None, False, None
-                    for t in iter_delimited(after_equals(), words):
-                        if isinstance(t, Token):
-                            if t.text == '=':
-                                assert key
-                                e = True
-                                bracket = None
-                            else:
-                                bracket = t.text
-                        elif isinstance(t, str):
-                            if key:
-                                assert e
-                                if bracket is None:
-                                    assert len(t) == 1
-                                    self.equate[key] = t
-                                elif bracket == '(':
-                                    self.equate[key] = tuple(t)
-                                elif bracket == '{':
-                                    self.equate[key] = set(t)
-                                else:  # pragma: no cover
-                                    raise ValueError(
-                                        'Invalid punctuation in EQUATE content: {}'.format(bracket))
-                                key, e = None, False
-                            else:
-                                key = t
-                elif subcommand == 'ITEMS':
-                    for w in iter_delimited(
-                            after_equals(), words, delimiter='()', allow_single_word=True):
-                        assert isinstance(w, str)
-                        self.items.append(w)
-            except StopIteration:
-                break
+                        setattr(self, *FORMAT_SWITCHES[subcommand])
+                elif subcommand in self._subcommand_readers:
+                    self._subcommand_readers[subcommand](self, words)
+        except StopIteration:  # The payload ended in the middle of a subcommand.
+            pass
         if self.datatype:
             self.datatype = self.datatype.upper()
-            assert self.datatype in {
-                'STANDARD', 'DNA', 'RNA', 'NUCLEOTIDE', 'PROTEIN', 'CONTINUOUS'}
+            assert self.datatype in FORMAT_DATATYPES
             if self.datatype == 'CONTINUOUS' and not self.nexus.cfg.ignore_unsupported:
                 raise NotImplementedError('DATATYPE=CONTINUOUS is not supported!')
-        self.items = [i.upper() for i in self.items]
-        assert all(
-            i in 'MIN MAX MEDIAN AVERAGE VARIANCE STDERROR SAMPLESIZE STATES'.split()
-            for i in self.items)
-        if not self.items:
+        if self.items:
+            self.items = [i.upper() for i in self.items]
+            assert FORMAT_ITEMS.issuperset(self.items)
+            if self.items != ['STATES']:
+                raise NotImplementedError('Only ITEMS=STATES is supported!')
+        else:
             self.items = ['STATES']
-        if self.items != ['STATES']:
-            raise NotImplementedError('Only ITEMS=STATES is supported!')
         if self.statesformat:
             self.statesformat = self.statesformat.upper()
-            assert self.statesformat in {'STATESPRESENT', 'INDIVIDUALS', 'COUNT', 'FREQUENCY'}
+            assert self.statesformat in FORMAT_STATESFORMATS
         else:
             self.statesformat = 'STATESPRESENT'
         if self.statesformat != 'STATESPRESENT':
             raise NotImplementedError(
                 'STATESFORMATs other than STATESPRESENT are not supported')
-        for attr in ['missing', 'gap', 'matchchar']:
-            c = getattr(self, attr)
-            if c:
-                assert len(c) == 1 and c not in INVALID_SYMBOLS
+        special = [c for c in (self.missing, self.gap, self.matchchar) if c]
+        assert all(len(c) == 1 for c in special) and INVALID_SYMBOLS_SET.isdisjoint(special)
         if self.tokens:
             raise NotImplementedError('TOKENS is not supported')
 
-        if self.datatype in {'DNA', 'RNA', 'NUCLEOTIDE'}:
-            T = 'U' if self.datatype == 'RNA' else 'T'
-            self.symbols.extend(list('ACG' + T))
-            self.equate.update(
-                R=set('AG'),
-                Y=set('C' + T),
-                M=set('AC'),
-                K=set('G' + T),
-                S=set('CG'),
-                W=set('A' + T),
-                H=set('AC' + T),
-                B=set('CG' + T),
-                V=set('ACG'),
-                D=set('AG' + T),
-                N=set('ACG' + T),
-                X=set('ACG' + T),
-            )
-            if self.datatype == 'NUCLEOTIDE':
-                self.equate.update(U='T')
-        elif self.datatype == 'PROTEIN':
-            self.symbols.extend(list('ACDEFGHIKLMNPQRSTVWY*'))
-            self.equate.update(B=set('DN'), Z=set('EQ'))
-
-        if not self.respectcase:
+        if self.equate and not self.respectcase:
+            # Only user-defined EQUATE macros need to be normalized, the keys of the macros implied
+            # by the datatype are upper case already.
             self.equate = {k.upper(): v for k, v in self.equate.items()}
 
-        invalid_equate = \
-            list(INVALID_SYMBOLS) + self.symbols + \
-            [self.missing or '', self.gap or '', self.matchchar or '']
-        assert not any(c in invalid_equate for c in self.equate)
+        if self.datatype in DATATYPE_EQUATE:
+            self.symbols.extend(DATATYPE_SYMBOLS[self.datatype])
+            self.equate.update(DATATYPE_EQUATE[self.datatype])
+
+        if self.equate:  # Typically, there are no EQUATE macros for STANDARD data.
+            invalid_equate = INVALID_SYMBOLS_SET.union(
+                self.symbols, (self.missing, self.gap, self.matchchar))
+            assert invalid_equate.isdisjoint(self.equate)
+
+    def _read_symbols(self, words):
+        self.explicit_symbols = True
+        self.symbols = []
+        next_token_text = word_after_equals(words)
+        if not next_token_text.startswith('"'):
+            self.symbols = list(next_token_text)
+        else:
+            for w in iter_delimited(next_token_text, words):
+                if isinstance(w, str):
+                    self.symbols.extend(w)
+                else:
+                    assert w.text in '+-'
+                    self.symbols.append(w.text)
+
+    def _read_equate(self, words):
+        key, e, bracket = None, False, None
+        for t in iter_delimited(word_after_equals(words), words):
+            if isinstance(t, Token):
+                if t.text == '=':
+                    assert key
+                    e = True
+                    bracket = None
+                else:
+                    bracket = t.text
+            elif isinstance(t, str):
+                if key:
+                    assert e
+                    if bracket is None:
+                        assert len(t) == 1
+                        self.equate[key] = t
+                    elif bracket == '(':
+                        self.equate[key] = tuple(t)
+                    elif bracket == '{':
+                        self.equate[key] = frozenset(t)
+                    else:  # pragma: no cover
+                        raise ValueError(
+                            'Invalid punctuation in EQUATE content: {}'.format(bracket))
+                    key, e = None, False
+                else:
+                    key = t
+
+    def _read_items(self, words):
+        for w in iter_delimited(
+                word_after_equals(words), words, delimiter='()', allow_single_word=True):
+            assert isinstance(w, str)
+            self.items.append(w)
+
+    # FORMAT subcommands with more complex values are read by dedicated methods:
+    _subcommand_readers = dict(SYMBOLS=_read_symbols, EQUATE=_read_equate, ITEMS=_read_items)
 
 
 class Charstatelabels(Payload):
@@ -504,7 +542,7 @@ class Charstatelabels(Payload):
     number; thus, 1 is not a valid name for the second character listed. State names cannot be
     applied if DATATYPE=CONTINUOUS.
 
-    :ivar typing.List[types.SimpleNamespace] characters:
+    :ivar typing.List[Character] characters:
 
     .. code-block:: python
 
@@ -524,43 +562,36 @@ class Charstatelabels(Payload):
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
         self.characters = []
-        names = set()
+        if not self._tokens:
+            return
         words = iter_words_and_punctuation(self._tokens, nexus=nexus)
         num, name, states, in_states, comma = None, None, [], False, False
 
-        while 1:
-            try:
-                w = next(words)
-                if num is None:
-                    num = int(w)
-                    continue
-                if isinstance(w, Token) and w.text == ',':
-                    comma = True  # We want to be able to detect trailing commas!
-                    if name and name in names:
-                        duplicate_charlabel(name, 'CHARSTATELABELS', nexus)
-                    names.add(name)
-                    self.characters.append(
-                        types.SimpleNamespace(number=num, name=name, states=states))
-                    num, name, states, in_states = None, None, [], False
-                    continue
-                if in_states:
-                    states.append(w)
-                    continue
-                if isinstance(w, Token) and w.text == '/':
-                    in_states = True
-                    continue
-                if name:
-                    raise ValueError(
-                        'Illegal token in charstatelabel: "{}{}"'.format(name, w))
-                name = w
-            except StopIteration:
-                break
+        for w in words:
+            if num is None:
+                num = int(w)
+                continue
+            if isinstance(w, Token) and w.text == ',':
+                comma = True  # We want to be able to detect trailing commas!
+                self.characters.append(Character(number=num, name=name, states=states))
+                num, name, states, in_states = None, None, [], False
+                continue
+            if in_states:
+                states.append(w)
+                continue
+            if isinstance(w, Token) and w.text == '/':
+                in_states = True
+                continue
+            if name:
+                raise ValueError(
+                    'Illegal token in charstatelabel: "{}{}"'.format(name, w))
+            name = w
         if num:
-            if name and name in names:
-                duplicate_charlabel(name, 'CHARSTATELABELS', nexus)
-            self.characters.append(types.SimpleNamespace(number=num, name=name, states=states))
+            self.characters.append(Character(number=num, name=name, states=states))
         elif comma:  # There was a comma, but no new label.
             warnings.warn('Trailing comma in CHARSTATELABELS command')
+        check_duplicate_charlabels(
+            (c.name for c in self.characters), 'CHARSTATELABELS', nexus)
 
 
 class Charlabels(Payload):
@@ -587,18 +618,19 @@ class Charlabels(Payload):
     CHARSTATELABELS command when writing NEXUS files, although programs should continue to read
     CHARLABELS because many existing NEXUS files use CHARLABELS.
 
-    :ivar typing.List[types.SimpleNamespace] characters:
+    :ivar typing.List[Character] characters:
     """
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
         self.characters = []
-        names = set()
-        for i, w in enumerate(iter_words_and_punctuation(self._tokens, nexus=nexus)):
-            assert isinstance(w, str)
-            if w and w in names:
-                duplicate_charlabel(w, 'CHARLABELS', nexus)
-            names.add(w)
-            self.characters.append(types.SimpleNamespace(number=i + 1, name=w, states=[]))
+        if not self._tokens:
+            return
+        names = list(iter_words_and_punctuation(self._tokens, nexus=nexus))
+        assert all(isinstance(w, str) for w in names)
+        check_duplicate_charlabels(names, 'CHARLABELS', nexus)
+        self.characters = [
+            Character(number=i, name=w, states=[])
+            for i, w in enumerate(names, start=1)]
 
 
 class Statelabels(Payload):
@@ -625,7 +657,7 @@ class Statelabels(Payload):
     CHARSTATELABELS command when writing NEXUS files, although programs should continue to read
     STATELABELS because many existing NEXUS files use STATELABELS.
 
-    :ivar typing.List[types.SimpleNamespace] characters:
+    :ivar typing.List[Character] characters:
     """
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
@@ -634,23 +666,18 @@ class Statelabels(Payload):
         words = iter_words_and_punctuation(self._tokens, nexus=nexus)
         num, states = None, []
 
-        while 1:
-            try:
-                w = next(words)
-                if num is None:
-                    num = int(w)
-                    continue
-                if isinstance(w, Token) and w.text == ',':
-                    self.characters.append(
-                        types.SimpleNamespace(number=num, name=None, states=states))
-                    num, states = None, []
-                    continue
-                assert isinstance(w, str)
-                states.append(w)
-            except StopIteration:
-                break
+        for w in words:
+            if num is None:
+                num = int(w)
+                continue
+            if isinstance(w, Token) and w.text == ',':
+                self.characters.append(Character(number=num, name=None, states=states))
+                num, states = None, []
+                continue
+            assert isinstance(w, str)
+            states.append(w)
         if num and states:
-            self.characters.append(types.SimpleNamespace(number=num, name=None, states=states))
+            self.characters.append(Character(number=num, name=None, states=states))
 
 
 class Matrix(Payload):
@@ -858,7 +885,9 @@ class Characters(Block):
         case given in FORMAT SYMBOLS, i.e. if a RESPECTCASE directive is missing and \
         FORMAT SYMBOLS="ABC", a value "a" in the matrix will be returned as "A".
         """
-        format = Format(None) if 'FORMAT' not in self.commands else self.FORMAT
+        format = self.FORMAT or Format(None)
+        # Membership of state symbols is checked for each entry of the matrix:
+        state_symbols = frozenset(format.symbols)
 
         # Determine dimensions and labels:
         ntax, taxlabels = self.get_taxlabels(format)
@@ -875,9 +904,9 @@ class Characters(Block):
         label, entries = None, []
         ncols, nrows = ntax if format.transpose else nchar, nchar if format.transpose else ntax
 
+        # Note: Lines of an interleaved matrix are consumed as they are read from the tokens.
         for i, line in enumerate(
-                list(iter_lines(self.MATRIX._tokens)) if format.interleave else
-                [self.MATRIX._tokens],
+                iter_lines(self.MATRIX._tokens) if format.interleave else [self.MATRIX._tokens],
                 start=1):
             words = iter_words_and_punctuation(
                 line, allow_punctuation_in_word='+-', nexus=self.nexus)
@@ -892,7 +921,7 @@ class Characters(Block):
                         if t.text == '(':
                             w = next(words)
                             symbols = ''
-                            while isinstance(w, str) or (w.text in format.symbols) \
+                            while isinstance(w, str) or (w.text in state_symbols) \
                                     or (w.text == ","):
                                 if isinstance(w, str) or w.text != ',':
                                     symbols += getattr(w, 'text', w)
@@ -902,19 +931,19 @@ class Characters(Block):
                         elif t.text == '{':
                             w = next(words)
                             vals = set()
-                            while isinstance(w, str) or (w.text in format.symbols) \
+                            while isinstance(w, str) or (w.text in state_symbols) \
                                     or (w.text == format.gap) or (w.text == ","):
                                 if isinstance(w, str) or w.text != ',':
                                     vals |= set(getattr(w, 'text', w))
                                 w = next(words)
                             assert w.text == '}', "Expected }"
                             entries.append(vals)
-                        elif t.text in format.symbols:  # pragma: no cover
+                        elif t.text in state_symbols:  # pragma: no cover
                             entries.append(t.text)
                         else:  # pragma: no cover
                             raise ValueError('Unexpected punctuation in matrix')
                     else:
-                        entries.extend(list(t))  # We split a word into a list of symbols.
+                        entries.extend(t)  # We split a word into a list of symbols.
                     if not format.interleave and (len(entries) == ncols):
                         res[label or (len(res) + 1)] = entries
                         label, entries = None, []
@@ -940,31 +969,34 @@ class Characters(Block):
                 return func(state, *args, **kw)
             if isinstance(state, tuple):
                 return tuple(func(s, *args, **kw) for s in state)
-            if isinstance(state, set):
+            if isinstance(state, (set, frozenset)):
                 return set(func(s, *args, **kw) for s in state)
             raise ValueError(state)  # pragma: no cover
 
         lax_symbols = not format.explicit_symbols and format.datatype in {None, 'STANDARD'} \
             and not (self.nexus and self.nexus.cfg.strict)
 
+        def normalized(c):
+            return c.upper() if c and not format.respectcase else c
+
+        # The special symbols are normalized once, rather than for each state in the matrix:
+        missing, gap, matchchar = (
+            normalized(c) for c in (format.missing, format.gap, format.matchchar))
+
         def replace_symbol(s, i, r):
-            if (format.respectcase and s == format.missing) or \
-                    (not format.respectcase and (s.upper() == format.missing.upper())):
+            c = normalized(s)
+            if c == missing:
                 return None
-            if format.gap:
-                if (format.respectcase and s == format.gap) or \
-                        (not format.respectcase and (s.upper() == format.gap.upper())):
-                    return GAP
-            if format.matchchar:  # match entries from first row!
-                if (format.respectcase and s == format.matchchar) or \
-                        (not format.respectcase and (s.upper() == format.matchchar.upper())):
-                    assert r
-                    return r[i]
-            if s not in format.symbols:
+            if gap and c == gap:
+                return GAP
+            if matchchar and c == matchchar:  # match entries from first row!
+                assert r
+                return r[i]
+            if s not in state_symbols:
                 s = s.lower() if s.isupper() else s.upper()
 
             if not lax_symbols:
-                assert s in format.symbols, '{} {}'.format(s, format.symbols)
+                assert s in state_symbols, '{} {}'.format(s, format.symbols)
             return s
 
         def resolve_symbols(s, i, r):
@@ -1067,9 +1099,9 @@ class Characters(Block):
         assert len(charlabels) == nchar
         return charlabels, statelabels
 
-    def validate(self, log=None):
-        res = super().validate(log)
-        if 'TAXLABELS' in self.commands and not self.DIMENSIONS.newtaxa:
+    def validate(self, log=None, deep=True):
+        res = super().validate(log, deep=deep)
+        if 'TAXLABELS' in self._commands_by_name and not self.DIMENSIONS.newtaxa:
             return log_or_raise(
                 'TAXLABELS may only be defined in {} block if NEWTAXA is specified.'.format(
                     self.name),
@@ -190,7 +190,7 @@ class Notes(Block):
 
     @property
     def texts(self):
-        return self.commands['TEXT']
+        return self._get_payloads('TEXT')
 
     def get_texts(self, taxon=None, character=None, tree=None):
         res = []
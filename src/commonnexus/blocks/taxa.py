@@ -18,7 +18,7 @@ class Dimensions(Payload):
     """
     def __init__(self, tokens, nexus=None):
         super().__init__(tokens, nexus=nexus)
-        text = [t.text for t in tokens if not t.is_whitespace]
+        text = [t.text for t in self._tokens if not t.is_whitespace]
         assert text[0].upper() == 'NTAX' and text[1] == '='
         self.ntax = int(text[2])
 
@@ -47,7 +47,7 @@ class Taxlabels(Payload):
         super().__init__(tokens, nexus=nexus)
         self.labels = collections.OrderedDict(
             [(n, w) for n, w in enumerate(
-                iter_words_and_punctuation(tokens, nexus=nexus), start=1)])
+                iter_words_and_punctuation(self._tokens, nexus=nexus), start=1)])
         assert len(self.labels) == len(set(self.labels.values())), 'Duplicates in TAXLABELS'
         assert not set(str(n) for n in self.labels).intersection(self.labels.values()), \
             'Numbers as labels'
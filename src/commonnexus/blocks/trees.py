@@ -307,10 +307,10 @@ class Trees(Block):
         Since TREE is one of the few NEXUS commands which may appear multiple times per block, we
         provide a shortcut to this list.
         """
-        return self.commands['TREE']
+        return self._get_payloads('TREE')
 
-    def validate(self, log=None):
-        super().validate(log=log)
+    def validate(self, log=None, deep=True):
+        super().validate(log=log, deep=deep)
         valid, with_translate, tree_seen = True, False, False
         for i, cmd in enumerate(self[1:-1]):
             if cmd.name not in self.payload_map:  # pragma: no cover
@@ -330,13 +330,13 @@ class Trees(Block):
 
     @functools.cached_property
     def translate_mapping(self):
-        mapping = {}
-        if 'TAXA' in self.linked_blocks:
+        mapping, linked_blocks = {}, self.linked_blocks
+        if 'TAXA' in linked_blocks:
             mapping.update({
-                str(k): v for k, v in self.linked_blocks['TAXA'].TAXLABELS.labels.items()})
+                str(k): v for k, v in linked_blocks['TAXA'].TAXLABELS.labels.items()})
         elif self.nexus.TAXA and self.nexus.TAXA.TAXLABELS:
             mapping.update({str(k): v for k, v in self.nexus.TAXA.TAXLABELS.labels.items()})
-        if 'TRANSLATE' in self.commands:
+        if 'TRANSLATE' in self._commands_by_name:
             mapping.update(self.TRANSLATE.mapping)
         return mapping
 
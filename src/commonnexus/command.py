@@ -1,3 +1,4 @@
+import sys
 import functools
 import itertools
 
@@ -14,7 +15,8 @@ class Command(tuple):
     """
     @functools.cached_property
     def name(self):
-        return get_name(self)
+        # Command names are used as keys in lookups, so we intern them.
+        return sys.intern(get_name(self))
 
     def __str__(self):
         return ''.join(str(t) for t in self)
@@ -91,15 +93,15 @@ class Command(tuple):
         tokens.extend(self[j:])
         return Command(tokens)
 
-    @property
+    @functools.cached_property
     def is_beginblock(self) -> bool:
         return self.name == 'BEGIN'
 
-    @property
+    @functools.cached_property
     def is_endblock(self) -> bool:
         # In MacClade, PAUP, and COMPONENT, the ENDBLOCK command has been used as
         # a synonym of the END command.
-        return self.name in ['END', 'ENDBLOCK']
+        return self.name in {'END', 'ENDBLOCK'}
 
     def iter_payload_tokens(self, type=None):
         found = False
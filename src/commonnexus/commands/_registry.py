@@ -0,0 +1,17 @@
+"""
+Registry of the available subcommands, mapping command names to the short help displayed in the
+list of commands of `commonnexus -h`.
+
+The registry allows setting up the CLI without importing all command modules. It must be kept in
+sync with the command modules in this package - which is checked in the test suite.
+"""
+COMMANDS = {
+    'characters': 'Manipulate the CHARACTERS (or DATA) block of a NEXUS file.',
+    'combine': 'Combine data from multiple NEXUS files and put it in a new one.',
+    'help': 'Get help on subcommands.',
+    'normalise': 'Normalise a NEXUS file.',
+    'split': 'Split a Mesquite multi-block NEXUS into individual NEXUS files per CHARACTERS/TREES '
+             'block.',
+    'taxa': 'Manipulate the list of TAXA used in a NEXUS file.',
+    'trees': 'Manipulate a TREES block in a NEXUS file.',
+}
@@ -5,9 +5,9 @@ import collections
 import dataclasses
 
 from .tokenizer import TokenType, iter_tokens, get_name
-from .util import log_or_raise
+from .util import log_or_raise, missing_attribute
 from commonnexus.command import Command
-from commonnexus.blocks import Block
+from commonnexus.blocks import Block, get_implementation
 
 __all__ = ['Config', 'Nexus']
 
@@ -171,14 +171,14 @@ class Nexus(list):
         appear in the NEXUS content.
 
         For a shortcut to access blocks which are known to appear just once in the NEXUS content,
-        see :meth:`Nexus.__getattribute__`.
+        see :meth:`Nexus.__getattr__`.
         """
         res = collections.defaultdict(list)
         for block in self.iter_blocks():
             res[block.name].append(block)
         return res
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
         """
         NEXUS does not make any prescriptions regarding how many blocks with the same name may
         exist in a file. Thus, the primary way to access blocks is by looking up the list of blocks
@@ -195,12 +195,11 @@ class Nexus(list):
             >>> len(nex.BLOCK.commands)
             1
         """
+        # Only called when regular attribute lookup fails, i.e. for block names - or when a
+        # property raises AttributeError.
         if name.isupper():
-            try:
-                return self.blocks[name][0]
-            except IndexError:
-                return None
-        return list.__getattribute__(self, name)
+            return next((block for block in self.iter_blocks() if block.name == name), None)
+        return missing_attribute(self, name)
 
     def __str__(self):
         """
@@ -261,14 +260,18 @@ class Nexus(list):
                 block.append(command)
                 # Look up a suitable Block implementation.
                 name = get_name(block[0].iter_payload_tokens())
-                yield self.block_implementations.get(name, Block)(self, block)
+                cls = self.block_implementations.get(name) or get_implementation(name) or Block
+                yield cls(self, block)
                 block = None
             elif command.is_beginblock:
                 block = [command]
             elif block is not None:
                 block.append(command)
 
-    def validate(self, log=None):
+    def validate(self, log=None, deep=True):
+        """
+        :param deep: Flag signaling whether to parse (and thus check) the payloads of all commands.
+        """
         valid = True
         if any(t.type not in {TokenType.WHITESPACE, TokenType.COMMENT} for t in self.leading):
             log_or_raise('Invalid token in preamble', log=log)
@@ -278,7 +281,7 @@ class Nexus(list):
             # some fixed order between commands.
             # If Payload.__multivalued__ == False, only one command instance is allowed, ...
             #
-            valid = valid and block.validate(log=log)
+            valid = valid and block.validate(log=log, deep=deep)
         if any(t.type not in {TokenType.WHITESPACE, TokenType.COMMENT}
                for t in self.trailing_whitespace):
             log_or_raise('Invalid token in text after the last command', log=log)
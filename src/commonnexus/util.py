@@ -8,3 +8,21 @@ def log_or_raise(msg, log=None, level='error'):
         getattr(log, level)(msg)
         return False
     raise ValueError(msg)
+
+
+def missing_attribute(obj, name):
+    """
+    Fallback for `__getattr__` implementations.
+
+    Since `__getattr__` is also called when a property raises `AttributeError`, we must not simply
+    report such attributes as missing. Instead, the property is evaluated again and an
+    `AttributeError` raised within it is turned into a `ValueError`.
+    """
+    cls = type(obj)
+    descriptor = getattr(cls, name, None)
+    if hasattr(descriptor, '__get__'):
+        try:
+            return descriptor.__get__(obj, cls)
+        except AttributeError as e:
+            raise ValueError('Error computing {}.{}: {}'.format(cls.__name__, name, e)) from e
+    raise AttributeError('{!r} object has no attribute {!r}'.format(cls.__name__, name))
@@ -25,3 +25,46 @@ def test_Block_with_nexus(cmds, kw, expect):
 
 def test_Block_as_string():
     assert str(Block.from_commands([])) == '\nBEGIN BLOCK;\nEND;'
+
+
+def test_lazy_block_implementations():
+    from commonnexus import blocks
+
+    assert 'Trees' in dir(blocks)
+    assert blocks.get_implementation('DATA') is blocks.Data
+    assert blocks.get_implementation('MYBLOCK') is None
+    with pytest.raises(AttributeError):
+        _ = blocks.Unknown
+
+
+def test_Block_linked_blocks():
+    assert Block.from_commands([]).linked_blocks == {}
+    assert Block.from_commands([], LINK='taxa = t').linked_blocks == {}
+
+    nex = Nexus()
+    nex.append_block(Block.from_commands([], name='taxa', TITLE='t', nexus=nex))
+    nex.append_block(Block.from_commands([], LINK='taxa = t', nexus=nex))
+    assert nex.BLOCK.linked_blocks['TAXA'].title == 'T'
+    assert not nex.TAXA.linked_blocks
+
+
+def test_Block_command_access():
+    block = Block.from_commands([('cmd', 'x')])
+    assert str(block.CMD) == 'x'
+    assert block.OTHER is None
+    assert 'OTHER' not in block.commands
+    with pytest.raises(AttributeError, match="'Block' object has no attribute 'unknown'"):
+        _ = block.unknown
+
+
+def test_Block_property_errors_not_masked():
+    nex = Nexus('#NEXUS BEGIN TAXA; TITLE =; END;')
+    with pytest.raises(ValueError, match="'Token' object has no attribute 'upper'"):
+        _ = nex.TAXA.title
+
+
+def test_Payload_tokens():
+    from commonnexus.blocks.base import Payload
+
+    assert Payload('a [c] b').comments == ['c']
+    assert str(Payload(iter(Payload('a b')._tokens))) == 'a b'
@@ -3,7 +3,9 @@ import warnings
 import pytest
 
 from commonnexus import Nexus, Config
-from commonnexus.blocks.characters import GAP, Characters
+from commonnexus.blocks.characters import (
+    GAP, Characters, Dimensions, Format, Charlabels, Charstatelabels,
+)
 
 
 def test_Eliminate(nexus):
@@ -13,6 +15,51 @@ def test_Eliminate(nexus):
     _ = nexus(CHARACTERS='ELIMINATE 1-3;').CHARACTERS.ELIMINATE
 
 
+@pytest.mark.parametrize(
+    'payload,newtaxa,ntax,nchar',
+    [
+        ('NCHAR=3', False, None, 3),
+        ('newtaxa ntax = 3 nchar=10', True, 3, 10),
+        ('NTAX=2 [comment] NCHAR [x]=\n5', False, 2, 5),
+        ('NT[comment within word]AX=2 NCHAR=4', False, 2, 4),
+        ("NCHAR='5'", False, None, 5),
+        ('NEWTAXA NTAX=0 NCHAR=0', True, 0, 0),
+    ]
+)
+def test_Dimensions(payload, newtaxa, ntax, nchar):
+    dims = Dimensions(payload)
+    assert (dims.newtaxa, dims.ntax, dims.nchar) == (newtaxa, ntax, nchar)
+
+
+@pytest.mark.parametrize('payload', ['NTAX=3', 'NEWTAXA NCHAR=3'])
+def test_Dimensions_invalid(payload):
+    with pytest.raises(AssertionError):
+        Dimensions(payload)
+
+
+@pytest.mark.parametrize(
+    'payload,attr,value',
+    [
+        ('labels=left', 'labels', True),
+        ('NOLABELS', 'labels', False),
+        ('TRANSPOSE=no', 'transpose', False),
+        ('interleave', 'interleave', True),
+    ]
+)
+def test_Format_switches(payload, attr, value):
+    assert getattr(Format(payload), attr) == value
+
+
+@pytest.mark.parametrize('payload,attr', [('LABELS=no', 'labels'), ('TOKENS=no', 'tokens')])
+def test_Format_switches_with_value(payload, attr):
+    """Regression: LABELS=no and TOKENS=no used to be read as LABELS and TOKENS."""
+    assert getattr(Format(payload), attr) is False
+
+
+def test_Format_incomplete():
+    assert Format('GAP=- MISSING').missing == '?'
+
+
 def test_Chars_1(nexus):
     nex = nexus(
         TAXA="DIMENSIONS  NTAX=3; TAXLABELS A B C;",
@@ -256,12 +303,36 @@ def test_Data_with_Options(nexus):
     assert nex.characters.OPTIONS.gapmode == 'missing'
 
 
+def test_Characters_lazy_payloads(nexus):
+    nex = nexus(
+        TAXA="TITLE t; TAXLABELS t1;",
+        CHARACTERS="LINK TAXA = t; DIMENSIONS NCHAR=1; CHARSTATELABELS 1 x y; MATRIX t1 1;")
+    block = nex.CHARACTERS
+    # Neither reading links nor shallow validation parses the (invalid) CHARSTATELABELS:
+    assert block.links == {'TAXA': 'T'}
+    assert block.linked_blocks['TAXA'].TAXLABELS.labels == {1: 't1'}
+    assert block.validate(deep=False)
+    assert not {'MATRIX', 'CHARSTATELABELS'}.intersection(block._payloads)
+
+
 def test_Data_with_duplicate_charlabels(nexus):
     with warnings.catch_warnings(record=True) as w:
         nex = nexus(DATA="DIMENSIONS NCHAR=2; CHARLABELS x x; MATRIX t1 1 1;")
         nex.characters.get_matrix()
         assert len(w) == 1, 'Expected 1 warning, got %r' % w
 
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        nex = nexus(DATA="DIMENSIONS NCHAR=4; CHARLABELS x y x x; MATRIX t1 1 1 1 1;")
+        assert [c.name for c in nex.characters.CHARLABELS.characters] == ['x', 'y', 'x', 'x']
+        assert len(w) == 2, 'Expected 2 warnings, got %r' % w
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        cmd = Charstatelabels('1 x, 2 y, 3 x, 4 x/a b')
+        assert cmd.characters[3].states == ['a', 'b']
+        assert len(w) == 2, 'Expected 2 warnings, got %r' % w
+
 
 def test_Data_with_mixed_charlabels(nexus):
     nex = nexus(DATA="DIMENSIONS NCHAR=2; CHARSTATELABELS 1 x, 2 ; MATRIX t1 1 1;")
@@ -320,3 +391,12 @@ END;""")
     nex.cfg.strict = True
     with pytest.raises(ValueError):
         _ = nex.DATA.CHARSTATELABELS
+
+
+def test_empty_payloads(mocker):
+    mocker.patch(
+        'commonnexus.blocks.characters.iter_words_and_punctuation',
+        mocker.Mock(side_effect=AssertionError('words must not be iterated')))
+    assert Charlabels([]).characters == []
+    assert Charstatelabels([]).characters == []
+    assert Format([]).items == ['STATES']
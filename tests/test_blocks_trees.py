@@ -113,3 +113,13 @@ def test_BEAST_like_trees():
     # tracerer counts trees using this pattern:
     # pattern = "(^tree STATE_)|(\tTREE \\* UNTITLED = \\[&R\\] \\()")
     assert any(line.startswith('tree STATE_1') for line in str(nex).split('\n'))
+
+
+def test_Trees_lazy_payloads():
+    nex = Nexus("""#NEXUS
+BEGIN TAXA; TITLE t; TAXLABELS a b; END;
+BEGIN TREES; LINK TAXA = t; TRANSLATE 1 a, 2 b; TREE t = (1,2); END;""")
+    block = nex.TREES
+    assert block.links == {'TAXA': 'T'}
+    assert block.translate_mapping['1'] == 'a'
+    assert 'TREE' not in block._payloads
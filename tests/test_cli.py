@@ -1,5 +1,7 @@
 import io
 import shlex
+import pathlib
+import argparse
 import logging
 
 import pytest
@@ -37,6 +39,56 @@ def test_help(main, capsys):
 
     main('help')
 
+    with pytest.raises(SystemExit):
+        main('-h taxa')
+    out, _ = capsys.readouterr()
+    assert 'Manipulate the list of TAXA' in out
+
+
+@pytest.mark.parametrize(
+    'argv,expected',
+    [
+        ([], None),
+        (['taxa', 'x.nex'], 'taxa'),
+        (['--log-level', 'DEBUG', 'taxa'], 'taxa'),
+        (['--log-level=DEBUG', 'taxa'], 'taxa'),
+        (['-h', 'taxa'], None),
+        (['taxa', '-h'], 'taxa'),
+        (['unknown', 'taxa'], None),
+    ]
+)
+def test_sniff_subcommand(argv, expected):
+    from commonnexus.__main__ import _sniff_subcommand
+
+    assert _sniff_subcommand(argv, ['taxa', 'trees']) == expected
+
+
+def test_command_registry():
+    import commonnexus.commands
+    from commonnexus.commands._registry import COMMANDS
+    from commonnexus.__main__ import _command_module, _command_help
+
+    assert list(COMMANDS) == sorted(
+        p.stem for p in pathlib.Path(commonnexus.commands.__file__).parent.glob('*.py')
+        if not p.stem.startswith('_'))
+    for name, help in COMMANDS.items():
+        assert _command_help(_command_module(name)).strip().splitlines()[0] == help
+
+
+def test_get_log():
+    from commonnexus.__main__ import get_log
+
+    log = get_log('test_get_log')
+    assert get_log('test_get_log', level=logging.DEBUG) is log
+    assert len(log.handlers) == 1 and log.handlers[0].level == logging.DEBUG
+
+
+def test_lazy_run(capsys):
+    from commonnexus.__main__ import _lazy_run
+
+    _lazy_run('help')(argparse.Namespace(command=None))
+    assert 'Run "commonnexus COMMAND -h"' in capsys.readouterr()[0]
+
 
 def test_split(main, tmp_path, fixture_dir, caplog):
     with caplog.at_level(logging.INFO):
@@ -104,6 +104,18 @@ def test_Nexus_modification():
     assert nex.BLOCK.OTHER
     nex.remove_block(nex.BLOCK)
     assert nex.BLOCK is None
+    with pytest.raises(AttributeError, match="'Nexus' object has no attribute 'unknown'"):
+        _ = nex.unknown
+
+
+def test_Nexus_property_errors_not_masked():
+    class MyNexus(Nexus):
+        @property
+        def broken(self):
+            return None.attribute
+
+    with pytest.raises(ValueError, match="'NoneType' object has no attribute 'attribute'"):
+        _ = MyNexus().broken
 
 
 def test_Nexus_replace_block():
@@ -139,6 +151,25 @@ def test_Nexus_validate(caplog):
     assert len(caplog.records) == 1
 
 
+@pytest.mark.parametrize(
+    'block,exception',
+    [
+        ('BEGIN TAXA; DIMENSIONS NTAX=2; TAXLABELS a a; END;', AssertionError),
+        ('BEGIN TAXA; DIMENSIONS NTAX=x; END;', ValueError),
+        ('BEGIN TREES; TREE t = ; END;', StopIteration),
+        (
+            'BEGIN CHARACTERS; DIMENSIONS NCHAR=1; CHARSTATELABELS 1 x y; MATRIX t1 1; END;',
+            ValueError),
+    ]
+)
+def test_Nexus_validate_deep(block, exception):
+    nex = Nexus('#NEXUS ' + block)
+    # Payloads are parsed lazily, so only a deep validation will detect invalid payloads:
+    assert nex.validate(deep=False)
+    with pytest.raises(exception):
+        nex.validate()
+
+
 def test_Config(fixture_dir):
     nex = Nexus.from_file(fixture_dir / 'christophchamp_basic.nex')
     assert nex.TREES.TREE.name == 'basic bush'
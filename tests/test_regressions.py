@@ -16,6 +16,15 @@ def test_UnquotedSymbols(regression):
     with warnings.catch_warnings(record=True) as w:
         nex = Nexus.from_file(regression / 'unquoted_symbols.nex')
         assert nex.DATA.FORMAT.symbols == ['0', '1']
+        # Payloads are parsed lazily, so warnings are only emitted upon access:
+        assert not w
+        assert nex.DATA.CHARSTATELABELS
+        assert len(w) == 72, 'Expected 72 warnings, got %r' % w
+
+    # Validation parses all payloads, thus emits all warnings:
+    with warnings.catch_warnings(record=True) as w:
+        nex = Nexus.from_file(regression / 'unquoted_symbols.nex')
+        assert nex.validate()
         assert len(w) == 72, 'Expected 72 warnings, got %r' % w
 
 